@@ -1,11 +1,29 @@
 import os
-import pathlib
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
-from urllib.parse import urlparse
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import fs as pfs
 import pandas as pd
-from fs.errors import FileExpected
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pds
+import pyarrow.parquet as pq
+from fs.errors import FileExpected, ResourceNotFound
 from fugue.dataframe import LocalBoundedDataFrame, LocalDataFrame, PandasDataFrame
 from triad.collections.dict import ParamDict
 from triad.collections.fs import FileSystem
@@ -13,39 +31,87 @@ from triad.collections.schema import Schema
 from triad.utils.assertion import assert_or_throw
 
 
+_URI_RE = re.compile(
+    r"^(?:(?P<scheme>[a-zA-Z][a-zA-Z0-9+\-.]*)://(?P<netloc>[^/]*))?(?P<path>.*)$",
+    re.DOTALL,
+)
+
+
+class _ParsedUri(NamedTuple):
+    scheme: str
+    netloc: str
+    path: str
+
+    def geturl(self) -> str:
+        if self.scheme == "":
+            return self.path
+        return self.scheme + "://" + self.netloc + self.path
+
+
+@lru_cache(maxsize=4096)
+def _parse_uri(uri: str) -> _ParsedUri:
+    # FileParser only sees scheme://netloc/path or plain paths, a precompiled
+    # regex is much cheaper than urlparse for these
+    scheme, netloc, path = _URI_RE.match(uri).groups()  # type: ignore
+    if scheme is None:
+        return _ParsedUri("", "", path)
+    return _ParsedUri(scheme.lower(), netloc, path)
+
+
 class FileParser(object):
+    __slots__ = (
+        "_orig_format_hint",
+        "_uri",
+        "_glob_pattern",
+        "_path",
+        "_format",
+        "suffix",
+    )
+
     def __init__(self, path: str, format_hint: Optional[str] = None):
-        last = len(path)
-        has_glob = False
         self._orig_format_hint = format_hint
-        for i in range(len(path)):
-            if path[i] in ["/", "\\"]:
-                last = i
-            if path[i] in ["*", "?"]:
-                has_glob = True
-                break
-        if not has_glob:
-            self._uri = urlparse(path)
+        # str.find and str.rfind scan in C, the glob starts at the first * or ?
+        # and the base is up to the last separator before the glob
+        star, question = path.find("*"), path.find("?")
+        glob_pos = question if star < 0 or 0 <= question < star else star
+        if glob_pos < 0:
+            self._uri = _parse_uri(path)
             self._glob_pattern = ""
             self._path = self._uri.path
         else:
-            self._uri = urlparse(path[:last])
+            last = max(path.rfind("/", 0, glob_pos), path.rfind("\\", 0, glob_pos))
+            if last < 0:
+                last = len(path)
+            self._uri = _parse_uri(path[:last])
             self._glob_pattern = path[last + 1 :]
             self._path = pfs.path.combine(self._uri.path, self._glob_pattern)
+        self.suffix = _get_suffix(self._path)
 
         if format_hint is None or format_hint == "":
-            for k, v in _FORMAT_MAP.items():
-                if self.suffix.endswith(k):
-                    self._format = v
-                    return
-            raise NotImplementedError(f"{self.suffix} is not supported")
+            fmt = _FORMAT_MAP.get(_get_format_key(self.suffix), None)
+            if fmt is None:
+                raise NotImplementedError(f"{self.suffix} is not supported")
+            self._format = fmt
         else:
             assert_or_throw(
-                format_hint in _FORMAT_MAP.values(),
+                format_hint in _FORMAT_VALUES,
                 NotImplementedError(f"{format_hint} is not supported"),
             )
             self._format = format_hint
 
+    @staticmethod
+    def _from_known(uri: Any, fmt: str) -> "FileParser":
+        # for files already resolved from a parent parser, this skips the
+        # parsing, the glob detection and the format resolution
+        res = FileParser.__new__(FileParser)
+        res._orig_format_hint = fmt
+        res._uri = uri
+        res._glob_pattern = ""
+        res._path = uri.path
+        res.suffix = _get_suffix(uri.path)
+        res._format = fmt
+        return res
+
     def assert_no_glob(self) -> "FileParser":
         assert_or_throw(self.glob_pattern == "", f"{self.path} has glob pattern")
         return self
@@ -83,32 +149,80 @@ class FileParser(object):
     def path(self) -> str:
         return self._path
 
-    @property
-    def suffix(self) -> str:
-        return "".join(pathlib.Path(self.path.lower()).suffixes)
-
     @property
     def file_format(self) -> str:
         return self._format
 
 
+def _get_suffix(path: str) -> str:
+    # same as "".join(pathlib.Path(path.lower()).suffixes)
+    name = path.rstrip("/").rpartition("/")[2].lower()
+    if name.endswith("."):
+        return ""
+    name = name.lstrip(".")
+    pos = name.find(".")
+    return "" if pos < 0 else name[pos:]
+
+
+def _get_format_key(suffix: str) -> str:
+    # the last suffix, or the last two if it is compressed, e.g. .csv.gz
+    head, _, ext = suffix.rpartition(".")
+    if ext == "gz" and "." in head:
+        return suffix[head.rfind(".") :]
+    return suffix[len(head) :]
+
+
 def load_df(
     uri: Union[str, List[str]],
     format_hint: Optional[str] = None,
     columns: Any = None,
     fs: Optional[FileSystem] = None,
+    parallel: bool = True,
     **kwargs: Any,
 ) -> LocalBoundedDataFrame:
     if isinstance(uri, str):
         fp = [FileParser(uri, format_hint)]
     else:
         fp = [FileParser(u, format_hint) for u in uri]
-    dfs: List[pd.DataFrame] = []
-    schema: Any = None
-    for f in _get_single_files(fp, fs):
-        df, schema = _FORMAT_LOAD[f.file_format](f.assert_no_glob(), columns, **kwargs)
-        dfs.append(df)
-    return PandasDataFrame(pd.concat(dfs), schema)
+    if columns is not None and not isinstance(columns, list):
+        columns = _to_schema(columns)  # parse once instead of once per file
+    files = list(_get_single_files(fp, fs))
+    if len(files) == 0:  # e.g. a glob pattern without matches
+        assert_or_throw(
+            columns is not None and not isinstance(columns, list),
+            lambda: ValueError(f"no file is found in {uri}"),
+        )
+        return PandasDataFrame(schema=columns)
+    if (
+        len(files) > 1
+        and all(f.file_format == "parquet" for f in files)
+        and not _use_pandas_parquet(kwargs)
+    ):
+        try:
+            # read all files as one dataset so the row groups of all files
+            # are read by the pyarrow thread pool and there is nothing to concat
+            res = _read_parquet_files(
+                [f.uri for f in files], columns, parallel, **kwargs
+            )
+            if res is not None:
+                return _to_pandas_df([res[0]], res[1])
+        except (IsADirectoryError, pa.ArrowInvalid, pa.ArrowTypeError):
+            # folders can't be in a list of paths, so load them one by one
+            pass
+
+    def _load(f: FileParser) -> Tuple[Any, Any]:
+        return _FORMAT_LOAD[f.file_format](f.assert_no_glob(), columns, **kwargs)
+
+    if parallel and len(files) > 1:
+        # the readers release the GIL while waiting on io, so the files can
+        # be loaded concurrently, map keeps the order of the files
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            results = list(executor.map(_load, files))
+    else:
+        results = [_load(f) for f in files]
+    dfs: List[Any] = [x[0] for x in results]
+    schema: Any = None if len(results) == 0 else results[-1][1]
+    return _to_pandas_df(dfs, schema)
 
 
 def save_df(
@@ -125,18 +239,87 @@ def save_df(
     p = FileParser(uri, format_hint).assert_no_glob()
     if fs is None:
         fs = FileSystem()
-    if fs.exists(uri):
-        assert_or_throw(mode == "overwrite", FileExistsError(uri))
-        try:
-            fs.remove(uri)
-        except Exception:
-            try:
-                fs.removetree(uri)
-            except Exception:  # pragma: no cover
-                pass
+    _remove_existing(fs, uri, mode)
     _FORMAT_SAVE[p.file_format](df, p, **kwargs)
 
 
+def _remove_existing(fs: FileSystem, uri: str, mode: str) -> None:
+    # one stat decides between file and folder, remote stores pay per call
+    try:
+        is_dir = fs.getinfo(uri).is_dir
+    except ResourceNotFound:
+        return
+    assert_or_throw(mode == "overwrite", FileExistsError(uri))
+    if is_dir:
+        fs.removetree(uri)
+    else:
+        fs.remove(uri)
+
+
+def _to_schema(columns: Any) -> Schema:
+    return columns if isinstance(columns, Schema) else Schema(columns)
+
+
+def _to_pandas_df(dfs: List[Any], schema: Any) -> PandasDataFrame:
+    # loaders may return pyarrow tables, concatenating them in arrow only
+    # merges the chunk lists, so there is a single conversion to pandas,
+    # arrow can't widen types, so tables with different schemas use pandas
+    if all(isinstance(x, pa.Table) and x.schema.equals(dfs[0].schema) for x in dfs):
+        tb = dfs[0] if len(dfs) == 1 else pa.concat_tables(dfs)
+        return PandasDataFrame.from_arrow(tb, schema)
+    pdf = pd.concat(
+        [x.to_pandas() if isinstance(x, pa.Table) else x for x in dfs],
+        copy=False,
+        ignore_index=True,
+    )
+    return PandasDataFrame(pdf, schema)
+
+
+def _concat_tables(tables: List[pa.Table]) -> pa.Table:
+    if all(x.schema.equals(tables[0].schema) for x in tables[1:]):
+        return pa.concat_tables(tables)
+    # arrow can't widen types or fill missing columns, pandas can
+    pdf = pd.concat([x.to_pandas() for x in tables], copy=False, ignore_index=True)
+    return pa.Table.from_pandas(pdf, preserve_index=False)
+
+
+def _cast_table(tb: pa.Table, pa_schema: pa.Schema) -> pa.Table:
+    # converting the types in arrow makes it part of the single to_pandas,
+    # only numbers are widened, other conversions such as to strings give
+    # different values in arrow, so PandasDataFrame converts them as before
+    types = {f.name: f.type for f in pa_schema}
+    fields = [
+        f.with_type(types[f.name])
+        if f.name in types and _is_widening(f.type, types[f.name])
+        else f
+        for f in tb.schema
+    ]
+    schema = pa.schema(fields, metadata=tb.schema.metadata)
+    if tb.schema.equals(schema):
+        return tb
+    try:
+        return tb.cast(schema)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return tb
+
+
+def _is_widening(tp: pa.DataType, target: pa.DataType) -> bool:
+    if tp.equals(target):
+        return False
+    if pa.types.is_integer(tp):
+        if pa.types.is_floating(target):
+            return True
+        if not pa.types.is_integer(target):
+            return False
+        if pa.types.is_signed_integer(tp) == pa.types.is_signed_integer(target):
+            return target.bit_width >= tp.bit_width
+        # unsigned to signed needs a wider type, signed to unsigned never fits
+        return pa.types.is_signed_integer(target) and target.bit_width > tp.bit_width
+    if pa.types.is_floating(tp) and pa.types.is_floating(target):
+        return target.bit_width >= tp.bit_width
+    return False
+
+
 def _get_single_files(
     fp: Iterable[FileParser], fs: Optional[FileSystem]
 ) -> Iterable[FileParser]:
@@ -144,35 +327,189 @@ def _get_single_files(
         fs = FileSystem()
     for f in fp:
         if f.glob_pattern != "":
-            files = [
-                FileParser(pfs.path.combine(f.uri, pfs.path.basename(x.path)))
-                for x in fs.opendir(f.uri).glob(f.glob_pattern)
-            ]
-            yield from _get_single_files(files, fs)
+            parent = f._uri.path or "/"
+            for name in _glob_names(fs, f.uri, f.glob_pattern):
+                path = pfs.path.combine(parent, name)
+                yield FileParser._from_known(f._uri._replace(path=path), f.file_format)
         else:
             yield f
 
 
+def _glob_names(fs: FileSystem, path: str, pattern: str) -> Iterable[str]:
+    if "/" in pattern:  # multi level patterns need the globber
+        for x in fs.opendir(path).glob(pattern):
+            yield pfs.path.basename(x.path)
+    else:
+        # a single listing call, opendir would stat the folder beforehand,
+        # this is an extra round trip on remote file systems
+        for x in fs.filterdir(path, files=[pattern], dirs=[pattern]):
+            yield x.name
+
+
 def _save_parquet(df: LocalDataFrame, p: FileParser, **kwargs: Any) -> None:
     df.as_pandas().to_parquet(
         p.uri, **{"engine": "pyarrow", "schema": df.schema.pa_schema, **kwargs}
     )
 
 
-def _load_parquet(
-    p: FileParser, columns: Any = None, **kwargs: Any
-) -> Tuple[pd.DataFrame, Any]:
-    if columns is None:
-        pdf = pd.read_parquet(p.uri, **{"engine": "pyarrow", **kwargs})
-        return pdf, None
+def _load_parquet(p: FileParser, columns: Any = None, **kwargs: Any) -> Tuple[Any, Any]:
+    return _read_parquet(p.uri, columns, **kwargs)
+
+
+def _read_parquet_files(
+    uris: List[str], columns: Any, parallel: bool, **kwargs: Any
+) -> Optional[Tuple[pa.Table, Any]]:
+    kw = {k: v for k, v in kwargs.items() if k != "engine"}
+    ds_kw = {k: kw.pop(k) for k in list(kw) if k in _PARQUET_DATASET_OPTIONS}
+    if any(k not in _PARQUET_SCAN_OPTIONS for k in kw):
+        return None  # only pq.read_table takes them
+    dataset = _parquet_dataset(uris, kw.get("pre_buffer", True), **ds_kw)
+    # a dataset has the schema of the first file, columns only in the other
+    # files would be dropped silently, so the files are read as one dataset
+    # only if all schemas are the same, the fragments keep the footers, so
+    # the scan doesn't read them again
+    fragments = list(dataset.get_fragments())
+    if parallel:
+        with ThreadPoolExecutor(max_workers=min(32, len(fragments))) as executor:
+            schemas = list(executor.map(lambda x: x.physical_schema, fragments))
+    else:
+        schemas = [x.physical_schema for x in fragments]
+    if not all(x.equals(schemas[0]) for x in schemas[1:]):
+        return None
+    return _read_parquet(dataset, columns, **kw)
+
+
+def _read_parquet(source: Any, columns: Any = None, **kwargs: Any) -> Tuple[Any, Any]:
+    kw = dict(kwargs)
+    schema: Any = None
+    names: Optional[Tuple[str, ...]] = None
     if isinstance(columns, list):  # column names
-        pdf = pd.read_parquet(p.uri, columns=columns, **{"engine": "pyarrow", **kwargs})
-        return pdf, None
-    schema = Schema(columns)
-    pdf = pd.read_parquet(
-        p.uri, columns=schema.names, **{"engine": "pyarrow", **kwargs}
+        names = tuple(columns)
+    elif columns is not None:
+        schema = _to_schema(columns)
+        names = tuple(schema.names)
+    if _use_pandas_parquet(kw):
+        pdf = pd.read_parquet(
+            source,
+            columns=None if names is None else list(names),
+            **{"engine": "pyarrow", **kw},
+        )
+        return pdf, schema
+    kw.pop("engine", None)
+    reader = _make_parquet_reader(
+        names,
+        None if schema is None else schema.pa_schema,
+        kw.pop("pre_buffer", True),
+        kw.pop("use_threads", True),
+        kw.pop("use_pandas_metadata", True),
+        kw.pop("batch_size", None),
     )
-    return pdf, schema
+    return reader(source, **kw), schema
+
+
+def _use_pandas_parquet(kwargs: Dict[str, Any]) -> bool:
+    # pandas arguments that pyarrow doesn't take are still handled by pandas
+    return kwargs.get("engine", "pyarrow") not in ["pyarrow", "auto"] or any(
+        k in _PANDAS_PARQUET_OPTIONS for k in kwargs
+    )
+
+
+@lru_cache(maxsize=128)
+def _make_parquet_reader(
+    columns: Optional[Tuple[str, ...]],
+    pa_schema: Optional[pa.Schema],
+    pre_buffer: bool,
+    use_threads: bool,
+    use_pandas_metadata: bool,
+    batch_size: Optional[int],
+) -> Callable[..., pa.Table]:
+    # the reader of each combination of columns, schema and options is built
+    # only once, repeated loads only call it with the source
+    # pre_buffer coalesces column chunk reads and prefetches them on the io
+    # thread pool, this is significant on high latency file systems such as
+    # S3, it can be turned off by setting pre_buffer=False
+    names = None if columns is None else list(columns)
+
+    def _cast(tb: pa.Table) -> pa.Table:
+        return tb if pa_schema is None else _cast_table(tb, pa_schema)
+
+    def read(source: Any, filters: Any = None, **kwargs: Any) -> pa.Table:
+        if batch_size is None and not isinstance(source, pds.Dataset):
+            return _cast(
+                pq.read_table(
+                    source,
+                    columns=names,
+                    filters=filters,
+                    pre_buffer=pre_buffer,
+                    use_threads=use_threads,
+                    use_pandas_metadata=use_pandas_metadata,
+                    **kwargs,
+                )
+            )
+        # read_table doesn't take batch_size or a dataset, so the dataset is
+        # scanned directly
+        if not isinstance(source, pds.Dataset):
+            source = _parquet_dataset(source, pre_buffer, **kwargs)
+        return _cast(
+            _scan_parquet(
+                source, names, filters, use_threads, use_pandas_metadata, batch_size
+            )
+        )
+
+    return read
+
+
+def _parquet_dataset(source: Any, pre_buffer: bool, **kwargs: Any) -> pds.Dataset:
+    for k in kwargs.keys():
+        assert_or_throw(
+            k in _PARQUET_DATASET_OPTIONS,
+            lambda: NotImplementedError(f"{k} is not supported with batch_size"),
+        )
+    fmt = pds.ParquetFileFormat(
+        default_fragment_scan_options=pds.ParquetFragmentScanOptions(
+            pre_buffer=pre_buffer
+        )
+    )
+    return pds.dataset(source, format=fmt, **kwargs)
+
+
+def _scan_parquet(
+    dataset: pds.Dataset,
+    columns: Optional[List[str]],
+    filters: Any,
+    use_threads: bool,
+    use_pandas_metadata: bool,
+    batch_size: Optional[int],
+) -> pa.Table:
+    # the same as pq.read_table, the index columns in the pandas metadata are
+    # always read and the metadata is kept after the projection
+    metadata = dataset.schema.metadata or {}
+    use_pandas_metadata = use_pandas_metadata and b"pandas" in metadata
+    if columns is not None and use_pandas_metadata:
+        index = dataset.schema.pandas_metadata.get("index_columns", [])
+        columns = columns + [
+            x for x in index if isinstance(x, str) and x not in columns
+        ]
+    kw: Dict[str, Any] = {} if batch_size is None else {"batch_size": batch_size}
+    tb = dataset.to_table(
+        columns=columns,
+        filter=None if filters is None else _filters_to_expression(filters),
+        use_threads=use_threads,
+        **kw,
+    )
+    if use_pandas_metadata:
+        tb = tb.replace_schema_metadata(
+            {**(tb.schema.metadata or {}), b"pandas": metadata[b"pandas"]}
+        )
+    return tb
+
+
+def _filters_to_expression(filters: Any) -> Any:
+    if isinstance(filters, pds.Expression):
+        return filters
+    if hasattr(pq, "filters_to_expression"):  # pyarrow>=10
+        return pq.filters_to_expression(filters)
+    return pq._filters_to_expression(filters)  # pragma: no cover
 
 
 def _save_csv(df: LocalDataFrame, p: FileParser, **kwargs: Any) -> None:
@@ -184,9 +521,11 @@ def _safe_load_csv(path: str, **kwargs: Any) -> pd.DataFrame:
         fs = FileSystem()
         return pd.concat(
             [
-                pd.read_csv(pfs.path.combine(path, pfs.path.basename(x.path)), **kwargs)
-                for x in fs.opendir(path).glob("*.csv")
-            ]
+                pd.read_csv(pfs.path.combine(path, name), **kwargs)
+                for name in _glob_names(fs, path, "*.csv")
+            ],
+            copy=False,
+            ignore_index=True,
         )
 
     try:
@@ -201,46 +540,207 @@ def _safe_load_csv(path: str, **kwargs: Any) -> pd.DataFrame:
         return load_dir()
 
 
-def _load_csv(  # noqa: C901
-    p: FileParser, columns: Any = None, **kwargs: Any
-) -> Tuple[pd.DataFrame, Any]:
+def _load_csv(p: FileParser, columns: Any = None, **kwargs: Any) -> Tuple[Any, Any]:
     kw = ParamDict(kwargs)
     infer_schema = kw.get("infer_schema", False)
     if infer_schema and columns is not None and not isinstance(columns, list):
         raise ValueError("can't set columns as a schema when infer schema is true")
-    if not infer_schema:
-        kw["dtype"] = object
     if "infer_schema" in kw:
         del kw["infer_schema"]
     header: Any = False
     if "header" in kw:
         header = kw["header"]
         del kw["header"]
+    if kw.get("engine", "") == "pandas":
+        del kw["engine"]
+    elif not infer_schema and all(k in _ARROW_CSV_PARSE_OPTIONS for k in kw):
+        # arrow would infer dates and times that pandas keeps as strings
+        return _load_csv_arrow(p, columns, header, kw)
+    pdf, schema = _load_csv_pandas(p, columns, header, infer_schema, kw)
+    if not infer_schema and _CSV_STRING_DTYPE is not object:
+        # hand over the arrow backed strings without copying, load_df converts
+        # them to pandas only once, without the pandas metadata they become
+        # plain strings with None as in the arrow engine, not string dtypes
+        tb = pa.Table.from_pandas(pdf, preserve_index=False)
+        tb = tb.replace_schema_metadata(None)
+        if schema is None:
+            return tb, None
+        return _cast_table(tb, schema.pa_schema), schema
+    return pdf, schema
+
+
+def _load_csv_pandas(  # noqa: C901
+    p: FileParser, columns: Any, header: Any, infer_schema: bool, kw: Dict[str, Any]
+) -> Tuple[pd.DataFrame, Any]:
+    if not infer_schema:
+        kw["dtype"] = _CSV_STRING_DTYPE
     if str(header) in ["True", "0"]:
-        pdf = _safe_load_csv(p.uri, **{"index_col": False, "header": 0, **kw})
         if columns is None:
+            pdf = _safe_load_csv(
+                p.uri, **{"index_col": False, "header": 0, "engine": "c", **kw}
+            )
             return pdf, None
         if isinstance(columns, list):  # column names
+            pdf = _safe_load_csv(
+                p.uri,
+                **{
+                    "index_col": False,
+                    "header": 0,
+                    "engine": "c",
+                    "usecols": _csv_usecols(columns),
+                    **kw,
+                },
+            )
             return pdf[columns], None
-        schema = Schema(columns)
+        schema = _to_schema(columns)
+        kw["dtype"] = _csv_dtypes(schema)
+        pdf = _safe_load_csv(
+            p.uri,
+            **{
+                "index_col": False,
+                "header": 0,
+                "engine": "c",
+                "usecols": _csv_usecols(schema.names),
+                **kw,
+            },
+        )
         return pdf[schema.names], schema
     if header is None or str(header) == "False":
         if columns is None:
             raise ValueError("columns must be set if without header")
         if isinstance(columns, list):  # column names
             pdf = _safe_load_csv(
-                p.uri, **{"index_col": False, "header": None, "names": columns, **kw}
+                p.uri,
+                **{
+                    "index_col": False,
+                    "header": None,
+                    "names": columns,
+                    "engine": "c",
+                    **kw,
+                },
             )
             return pdf, None
-        schema = Schema(columns)
+        schema = _to_schema(columns)
+        kw["dtype"] = _csv_dtypes(schema)
         pdf = _safe_load_csv(
-            p.uri, **{"index_col": False, "header": None, "names": schema.names, **kw}
+            p.uri,
+            **{
+                "index_col": False,
+                "header": None,
+                "names": schema.names,
+                "engine": "c",
+                **kw,
+            },
         )
         return pdf, schema
     else:
         raise NotImplementedError(f"{header} is not supported")
 
 
+def _load_csv_arrow(  # noqa: C901
+    p: FileParser, columns: Any, header: Any, kw: Dict[str, Any]
+) -> Tuple[pa.Table, Any]:
+    fs = FileSystem()
+    schema: Any = None
+    names: Optional[List[str]] = None
+    if isinstance(columns, list):  # column names
+        names = columns
+    elif columns is not None:
+        schema = _to_schema(columns)
+        names = schema.names
+    parse_options = pacsv.ParseOptions(
+        **{_ARROW_CSV_PARSE_OPTIONS[k]: v for k, v in kw.items()}
+    )
+    if str(header) in ["True", "0"]:
+        read_options = pacsv.ReadOptions(
+            use_threads=True, block_size=_ARROW_CSV_BLOCK_SIZE
+        )
+    elif header is None or str(header) == "False":
+        if names is None:
+            raise ValueError("columns must be set if without header")
+        read_options = pacsv.ReadOptions(
+            column_names=names, use_threads=True, block_size=_ARROW_CSV_BLOCK_SIZE
+        )
+    else:
+        raise NotImplementedError(f"{header} is not supported")
+
+    def get_convert_options(path: str, data: pa.Buffer) -> pacsv.ConvertOptions:
+        if schema is not None:
+            types = {f.name: f.type for f in schema.fields}
+        elif names is not None:
+            types = {n: pa.string() for n in names}
+        else:  # every column in the header is a string column
+            cols = pacsv.open_csv(
+                _get_arrow_input(path, data),
+                read_options=pacsv.ReadOptions(use_threads=False),
+                parse_options=parse_options,
+            ).schema.names
+            types = {n: pa.string() for n in cols}
+        return pacsv.ConvertOptions(
+            column_types=types,
+            include_columns=names or [],
+            strings_can_be_null=True,
+        )
+
+    def load(path: str) -> pa.Table:
+        data = _read_arrow_buffer(fs, path)
+        try:
+            return pacsv.read_csv(
+                _get_arrow_input(path, data),
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=get_convert_options(path, data),
+            )
+        except pa.ArrowInvalid as e:
+            if str(e).startswith("CSV parse error"):  # as the pandas reader
+                raise pd.errors.ParserError(str(e)) from e
+            raise
+
+    try:
+        return load(p.uri), schema
+    except (IsADirectoryError, PermissionError, FileExpected):
+        tables = [
+            load(pfs.path.combine(p.uri, name))
+            for name in _glob_names(fs, p.uri, "*.csv")
+        ]
+        return pa.concat_tables(tables), schema
+
+
+def _read_arrow_buffer(fs: FileSystem, path: str) -> pa.Buffer:
+    # the threaded arrow readers can deadlock when reading a python file
+    # object fails, so they only get native inputs, local files are memory
+    # mapped, other files are read with a single call, the header and the
+    # data are then parsed from the same buffer
+    uri = _parse_uri(path)
+    if uri.scheme not in ["", "file"]:
+        return pa.py_buffer(fs.readbytes(path))
+    if os.path.isdir(uri.path):
+        raise IsADirectoryError(path)
+    return pa.memory_map(uri.path).read_buffer()
+
+
+def _get_arrow_input(path: str, data: pa.Buffer) -> Any:
+    if path.lower().endswith(".gz"):
+        return pa.CompressedInputStream(pa.BufferReader(data), "gzip")
+    return pa.BufferReader(data)
+
+
+def _csv_usecols(names: List[str]) -> Callable[[str], bool]:
+    # a callable doesn't fail on missing columns, so the following projection
+    # still raises KeyError as before, but the parser skips unused fields
+    keys = set(names)
+    return lambda x: x in keys
+
+
+def _csv_dtypes(schema: Schema) -> Dict[str, Any]:
+    # only floats and strings can be parsed directly with nulls, other types
+    # are loaded as strings and converted by PandasDataFrame
+    return {
+        k: float if pa.types.is_floating(v.type) else _CSV_STRING_DTYPE
+        for k, v in schema.items()
+    }
+
+
 def _save_json(df: LocalDataFrame, p: FileParser, **kwargs: Any) -> None:
     df.as_pandas().to_json(p.uri, **{"orient": "records", "lines": True, **kwargs})
 
@@ -253,9 +753,11 @@ def _safe_load_json(path: str, **kwargs: Any) -> pd.DataFrame:
         fs = FileSystem()
         return pd.concat(
             [
-                pd.read_json(pfs.path.combine(path, pfs.path.basename(x.path)), **kw)
-                for x in fs.opendir(path).glob("*.json")
-            ]
+                pd.read_json(pfs.path.combine(path, name), **kw)
+                for name in _glob_names(fs, path, "*.json")
+            ],
+            copy=False,
+            ignore_index=True,
         )
 
 
@@ -267,7 +769,7 @@ def _load_json(
         return pdf, None
     if isinstance(columns, list):  # column names
         return pdf[columns], None
-    schema = Schema(columns)
+    schema = _to_schema(columns)
     return pdf[schema.names], schema
 
 
@@ -304,36 +806,48 @@ def _save_avro(df: LocalDataFrame, p: FileParser, **kwargs: Any):
     )
 
 
-def _load_avro(
-    p: FileParser, columns: Any = None, **kwargs: Any
-) -> Tuple[pd.DataFrame, Any]:
+def _load_avro(p: FileParser, columns: Any = None, **kwargs: Any) -> Tuple[Any, Any]:
+    schema: Any = None
+    names: Optional[List[str]] = None
+    if isinstance(columns, list):  # column names
+        names = columns
+    elif columns is not None:
+        schema = _to_schema(columns)
+        names = schema.names
+
     path = p.uri
     try:
-        pdf = _load_single_avro(path, **kwargs)
+        df = _load_single_avro(path, names, **kwargs)
     except (IsADirectoryError, PermissionError, FileExpected):
         fs = FileSystem()
-        pdf = pd.concat(
-            [
-                _load_single_avro(
-                    pfs.path.combine(path, pfs.path.basename(x.path)), **kwargs
-                )
-                for x in fs.opendir(path).glob("*.avro")
-            ]
-        )
-
-    if columns is None:
-        return pdf, None
-    if isinstance(columns, list):  # column names
-        return pdf[columns], None
+        dfs = [
+            _load_single_avro(pfs.path.combine(path, name), names, **kwargs)
+            for name in _glob_names(fs, path, "*.avro")
+        ]
+        if all(isinstance(x, pa.Table) for x in dfs):
+            df = _concat_tables(dfs)
+        else:
+            df = pd.concat(
+                [x.to_pandas() if isinstance(x, pa.Table) else x for x in dfs],
+                copy=False,
+                ignore_index=True,
+            )
 
-    schema = Schema(columns)
+    if names is None:
+        return df, None
+    if isinstance(df, pd.DataFrame):
+        return df[names], schema
+    if schema is None:
+        return _select_columns(df, names), None
 
-    # Return created DataFrame
-    return pdf[schema.names], schema
+    # Return created Table
+    return _cast_table(_select_columns(df, names), schema.pa_schema), schema
 
 
-def _load_single_avro(path: str, **kwargs: Any) -> pd.DataFrame:
-    from fastavro import reader
+def _load_single_avro(
+    path: str, columns: Optional[List[str]] = None, **kwargs: Any
+) -> Any:
+    from fastavro import block_reader, reader
 
     kw = ParamDict(kwargs)
     process_record = None
@@ -343,39 +857,189 @@ def _load_single_avro(path: str, **kwargs: Any) -> pd.DataFrame:
 
     fs = FileSystem()
     with fs.openbin(path) as fp:
-        # Configure Avro reader
-        avro_reader = reader(fp)
-        # Load records in memory
         if process_record:
-            records = [process_record(r) for r in avro_reader]
+            # processed records may not follow the writer schema
+            records = [process_record(r) for r in reader(fp)]
+            return pd.DataFrame.from_records(records)
 
-        else:
-            records = list(avro_reader)
+        blocks = block_reader(fp)
+        avro_schema = blocks.writer_schema
+        if columns is not None:
+            projected = _project_avro_schema(avro_schema, columns)
+            if projected is not None:
+                # fastavro skips the fields missing in the reader schema
+                # without decoding them
+                fp.seek(0)
+                blocks = block_reader(fp, reader_schema=projected)
+                avro_schema = projected
+        fields = avro_schema["fields"]
+        names = [f["name"] for f in fields]
+        types = [_avro_to_arrow(f["type"]) for f in fields]
+        if any(t is None for t in types):
+            # arrow would infer maps and mixed unions differently, e.g. a map
+            # as a struct of all keys, so pandas loads them as before
+            return pd.DataFrame.from_records(
+                list(chain.from_iterable(blocks)), columns=names
+            )
 
-        # Populate pandas.DataFrame with records
-        return pd.DataFrame.from_records(records)
+        # Decode block by block into record batches of the known schema
+        schema = pa.schema(list(zip(names, types)))
+        batches: List[pa.RecordBatch] = []
+        for block in blocks:
+            data = _avro_records_to_columns(block, names)
+            arrays = [pa.array(data[n], type=t) for n, t in zip(names, types)]
+            batches.append(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        return pa.Table.from_batches(batches, schema=schema)
 
 
-_FORMAT_MAP: Dict[str, str] = {
-    ".csv": "csv",
-    ".csv.gz": "csv",
-    ".parquet": "parquet",
-    ".json": "json",
-    ".json.gz": "json",
-    ".avro": "avro",
-    ".avro.gz": "avro",
+def _project_avro_schema(
+    writer_schema: Dict[str, Any], columns: List[str]
+) -> Optional[Dict[str, Any]]:
+    from fastavro import parse_schema
+    from fastavro.schema import SchemaParseException, UnknownType
+
+    keys = set(columns)
+    fields = [f for f in writer_schema["fields"] if f["name"] in keys]
+    if len(fields) == len(writer_schema["fields"]):
+        return None
+    projected = {k: v for k, v in writer_schema.items() if not k.startswith("__")}
+    projected["fields"] = fields
+    try:
+        parse_schema(projected)
+    except (SchemaParseException, UnknownType):
+        # a named type used by the remaining fields is defined in a skipped one
+        return None
+    return projected
+
+
+def _avro_records_to_columns(
+    records: Iterable[Dict[str, Any]], names: List[str]
+) -> Dict[str, List[Any]]:
+    # Accumulate the records into columns, so the rows don't need to be
+    # pivoted into a dataframe afterwards
+    data: Dict[str, List[Any]] = {n: [] for n in names}
+    appends = [(n, data[n].append) for n in names]
+    for r in records:
+        for n, append in appends:
+            append(r.get(n))
+    return data
+
+
+def _avro_to_arrow(tp: Any) -> Optional[pa.DataType]:  # noqa: C901
+    # None means the type can't be determined from the avro schema, ints and
+    # floats are widened to match what the pandas based loader produced
+    if isinstance(tp, list):  # union
+        tps = [x for x in tp if x != "null"]
+        return _avro_to_arrow(tps[0]) if len(tps) == 1 else None
+    if isinstance(tp, str):
+        return _AVRO_TYPES.get(tp, None)
+    if not isinstance(tp, dict):  # pragma: no cover
+        return None
+    if "logicalType" in tp:
+        if tp["logicalType"] == "decimal":
+            return pa.decimal128(tp["precision"], tp.get("scale", 0))
+        return _AVRO_LOGICAL_TYPES.get(tp["logicalType"], None)
+    if tp["type"] == "record":
+        fields = [(f["name"], _avro_to_arrow(f["type"])) for f in tp["fields"]]
+        if any(t is None for _, t in fields):
+            return None
+        return pa.struct(fields)
+    if tp["type"] == "array":
+        item = _avro_to_arrow(tp["items"])
+        return None if item is None else pa.list_(item)
+    if tp["type"] == "enum":
+        return pa.string()
+    if tp["type"] == "fixed":
+        return pa.binary(tp["size"])
+    if tp["type"] == "map":
+        return None
+    return _avro_to_arrow(tp["type"])
+
+
+def _select_columns(tb: pa.Table, names: List[str]) -> pa.Table:
+    return pa.Table.from_arrays([tb.column(n) for n in names], names=names)
+
+
+_AVRO_TYPES: Dict[str, pa.DataType] = {
+    "null": pa.null(),
+    "boolean": pa.bool_(),
+    "int": pa.int64(),
+    "long": pa.int64(),
+    "float": pa.float64(),
+    "double": pa.float64(),
+    "bytes": pa.binary(),
+    "string": pa.string(),
 }
 
-_FORMAT_LOAD: Dict[str, Callable[..., Tuple[pd.DataFrame, Any]]] = {
-    "csv": _load_csv,
-    "parquet": _load_parquet,
-    "json": _load_json,
-    "avro": _load_avro,
+_AVRO_LOGICAL_TYPES: Dict[str, pa.DataType] = {
+    "date": pa.date32(),
+    "time-millis": pa.time32("ms"),
+    "time-micros": pa.time64("us"),
+    "timestamp-millis": pa.timestamp("ms", tz="UTC"),
+    "timestamp-micros": pa.timestamp("us", tz="UTC"),
+    "local-timestamp-millis": pa.timestamp("ms"),
+    "local-timestamp-micros": pa.timestamp("us"),
 }
 
-_FORMAT_SAVE: Dict[str, Callable] = {
-    "csv": _save_csv,
-    "parquet": _save_parquet,
-    "json": _save_json,
-    "avro": _save_avro,
+# pd.read_parquet arguments that are not pq.read_table arguments
+_PANDAS_PARQUET_OPTIONS = frozenset(
+    ["storage_options", "use_nullable_dtypes", "dtype_backend"]
+)
+
+# pq.read_table arguments that are pds.dataset arguments
+_PARQUET_DATASET_OPTIONS = frozenset(["filesystem", "partitioning", "ignore_prefixes"])
+
+# arguments of _read_parquet when scanning a dataset
+_PARQUET_SCAN_OPTIONS = frozenset(
+    ["filters", "pre_buffer", "use_threads", "use_pandas_metadata", "batch_size"]
+)
+
+# pandas read_csv arguments that can be handled by the pyarrow csv reader
+_ARROW_CSV_PARSE_OPTIONS: Dict[str, str] = {
+    "sep": "delimiter",
+    "delimiter": "delimiter",
+    "quotechar": "quote_char",
+    "escapechar": "escape_char",
 }
+
+_ARROW_CSV_BLOCK_SIZE = 8 << 20
+
+# pyarrow backed strings don't need a python object per cell, they require
+# pandas 2 and pyarrow 7
+_CSV_STRING_DTYPE: Any = (
+    "string[pyarrow]"
+    if int(pd.__version__.split(".")[0]) >= 2 and int(pa.__version__.split(".")[0]) >= 7
+    else object
+)
+
+_FORMAT_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        ".csv": "csv",
+        ".csv.gz": "csv",
+        ".parquet": "parquet",
+        ".json": "json",
+        ".json.gz": "json",
+        ".avro": "avro",
+        ".avro.gz": "avro",
+    }
+)
+
+_FORMAT_VALUES = frozenset(_FORMAT_MAP.values())
+
+_FORMAT_LOAD: Mapping[str, Callable[..., Tuple[Any, Any]]] = MappingProxyType(
+    {
+        "csv": _load_csv,
+        "parquet": _load_parquet,
+        "json": _load_json,
+        "avro": _load_avro,
+    }
+)
+
+_FORMAT_SAVE: Mapping[str, Callable] = MappingProxyType(
+    {
+        "csv": _save_csv,
+        "parquet": _save_parquet,
+        "json": _save_json,
+        "avro": _save_avro,
+    }
+)
@@ -73,6 +73,24 @@ class PandasDataFrame(LocalBoundedDataFrame):
         super().__init__(schema, metadata)
         self._native = pdf
 
+    @staticmethod
+    def from_arrow(
+        table: pa.Table, schema: Any = None, metadata: Any = None
+    ) -> "PandasDataFrame":
+        """Create from a :func:`pyarrow.Table <pa:pyarrow.table>`, the conversion
+        releases the memory of the table so it can't be used afterwards
+
+        :param table: the arrow table, the columns already having the types of
+          ``schema`` are only checked, the other columns, and integer and boolean
+          columns with nulls, are converted by pandas as in the constructor
+        :param schema: |SchemaLikeObject|, defaults to None (inferred from
+          the converted pandas dataframe)
+        :param metadata: dict-like object with string keys, default ``None``
+        :return: the pandas dataframe
+        """
+        pdf = table.to_pandas(self_destruct=True, split_blocks=True)
+        return PandasDataFrame(pdf, schema, metadata)
+
     @property
     def native(self) -> pd.DataFrame:
         """Pandas DataFrame"""
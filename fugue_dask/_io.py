@@ -1,8 +1,9 @@
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import fs as pfs
+import pyarrow as pa
 from dask import dataframe as dd
-from fugue._utils.io import FileParser, _get_single_files
+from fugue._utils.io import FileParser, _get_single_files, _remove_existing
 from fugue._utils.io import _load_avro as _pd_load_avro
 from fugue._utils.io import _save_avro
 from triad.collections.dict import ParamDict
@@ -47,15 +48,7 @@ def save_df(
     p = FileParser(uri, format_hint).assert_no_glob()
     if fs is None:
         fs = FileSystem()
-    if fs.exists(uri):
-        assert_or_throw(mode == "overwrite", FileExistsError(uri))
-        try:
-            fs.remove(uri)
-        except Exception:
-            try:
-                fs.removetree(uri)
-            except Exception:  # pragma: no cover
-                pass
+    _remove_existing(fs, uri, mode)
     _FORMAT_SAVE[p.file_format](df, p, **kwargs)
 
 
@@ -157,7 +150,8 @@ def _load_avro(
     p: FileParser, columns: Any = None, **kwargs: Any
 ) -> Tuple[dd.DataFrame, Any]:
     # TODO: change this hacky implementation!
-    pdf, schema = _pd_load_avro(p, columns, **kwargs)
+    df, schema = _pd_load_avro(p, columns, **kwargs)
+    pdf = df.to_pandas() if isinstance(df, pa.Table) else df
 
     return dd.from_pandas(pdf, npartitions=4), schema
 
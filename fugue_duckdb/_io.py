@@ -2,7 +2,7 @@ import os
 from typing import Any, Iterable, List, Optional, Union
 
 from duckdb import DuckDBPyConnection
-from fugue._utils.io import FileParser, load_df, save_df
+from fugue._utils.io import FileParser, _remove_existing, load_df, save_df
 from fugue.dataframe import ArrowDataFrame, LocalBoundedDataFrame
 from triad import ParamDict, Schema
 from triad.collections.fs import FileSystem
@@ -77,15 +77,7 @@ class DuckDBIO:
                 ldf, uri=uri, format_hint=format_hint, mode=mode, fs=self._fs, **kwargs
             )
         fs = self._fs
-        if fs.exists(uri):
-            assert_or_throw(mode == "overwrite", FileExistsError(uri))
-            try:
-                fs.remove(uri)
-            except Exception:
-                try:
-                    fs.removetree(uri)
-                except Exception:  # pragma: no cover
-                    pass
+        _remove_existing(fs, uri, mode)
         if not fs.exists(p.parent):
             fs.makedirs(p.parent, recreate=True)
         self._format_save[p.file_format](df, p, **kwargs)
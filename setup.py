@@ -33,7 +33,7 @@ setup(
         "adagio>=0.2.3",
         "qpd>=0.2.6",
         "sqlalchemy",
-        "pyarrow>=0.15.1",
+        "pyarrow>=5.0.0",
         "pandas>=1.0.2",
         "importlib-metadata; python_version < '3.8'",
     ],
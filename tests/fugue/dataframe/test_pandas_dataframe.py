@@ -5,6 +5,7 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from fugue.dataframe import PandasDataFrame
 from fugue.dataframe.array_dataframe import ArrayDataFrame
 from fugue.dataframe.utils import _df_eq as df_eq
@@ -61,6 +62,21 @@ def test_init():
     raises(Exception, lambda: PandasDataFrame(123))
 
 
+def test_from_arrow():
+    tb = pa.Table.from_pydict({"a": ["x", None], "b": [1, 2]})
+    df = PandasDataFrame.from_arrow(tb)
+    assert df.schema == "a:str,b:long"
+    assert [["x", 1], [None, 2]] == df.as_array()
+    tb = pa.Table.from_pydict({"a": ["x", None], "b": [1, 2]})
+    df = PandasDataFrame.from_arrow(tb, "a:str,b:int")
+    assert df.schema == "a:str,b:int"
+    assert [["x", 1], [None, 2]] == df.as_array(type_safe=True)
+    tb = pa.Table.from_pydict({"a": [1, None]})
+    df = PandasDataFrame.from_arrow(tb, "a:long")
+    assert df.schema == "a:long"
+    assert [[1], [None]] == df.as_array(type_safe=True)
+
+
 def test_simple_methods():
     df = PandasDataFrame([], "a:str,b:int")
     assert df.as_pandas() is df.native
@@ -1,9 +1,11 @@
 import os
 
+import pandas as pd
+
 from fugue.dataframe.array_dataframe import ArrayDataFrame
 from fugue.dataframe.pandas_dataframe import PandasDataFrame
 from fugue.dataframe.utils import _df_eq as df_eq
-from fugue._utils.io import FileParser, load_df, save_df, _FORMAT_MAP
+from fugue._utils.io import FileParser, load_df, save_df, _CSV_STRING_DTYPE, _FORMAT_MAP
 from fugue.exceptions import FugueDataFrameOperationError
 from pytest import raises
 from triad.collections.fs import FileSystem
@@ -62,6 +64,12 @@ def test_file_parser():
     assert "" == f.suffix
     assert "csv" == f.file_format
 
+    f = FileParser("file:///a/b/c.parquet")
+    assert "file:///a/b/c.parquet" == f.uri
+    assert "file" == f.scheme
+    assert "/a/b/c.parquet" == f.path
+    assert "file:///a/b" == f.parent
+
     raises(NotImplementedError, lambda: FileParser("s3://a/b/c.ppp"))
     raises(NotImplementedError, lambda: FileParser("s3://a/b/c.parquet", "csvv"))
     raises(NotImplementedError, lambda: FileParser("s3://a/b/c"))
@@ -149,6 +157,20 @@ def test_parquet_io(tmpdir):
     # load multiple paths
     actual = load_df([f1, f2], "parquet")
     df_eq(actual, [["1", 2, 3], ["1", 2, 3]], "a:str,b:int,c:long")
+    actual = load_df([f1, f2], "parquet", parallel=False)
+    df_eq(actual, [["1", 2, 3], ["1", 2, 3]], "a:str,b:int,c:long")
+    actual = load_df([f1, f2], "parquet", columns=["b", "a"], batch_size=1)
+    df_eq(actual, [[2, "1"], [2, "1"]], "b:int,a:str", throw=True)
+
+    # read_table arguments with and without batch_size
+    path = os.path.join(tmpdir, "filter.parquet")
+    save_df(PandasDataFrame([[1, "x"], [2, "y"]], "a:long,b:str"), path)
+    for kw in [{}, {"batch_size": 10}]:
+        actual = load_df(path, filters=[("a", "=", 1)], **kw)
+        df_eq(actual, [[1, "x"]], "a:long,b:str", throw=True)
+        actual = load_df(path, columns=["b"], filters=[("a", "=", 2)], **kw)
+        df_eq(actual, [["y"]], "b:str", throw=True)
+    raises(NotImplementedError, lambda: load_df(path, buffer_size=10, batch_size=10))
 
     # load folder
     actual = load_df(folder, "parquet")
@@ -161,11 +183,22 @@ def test_parquet_io(tmpdir):
     actual = load_df(os.path.join(tmpdir, "folder", "*.parquet"))
     df_eq(actual, [["1", 2, 3], ["1", 2, 3]], "a:str,b:int,c:long")
 
+    # load pattern without matches
+    actual = load_df(os.path.join(tmpdir, "folder", "*x.parquet"), columns="a:str")
+    df_eq(actual, [], "a:str", throw=True)
+    raises(ValueError, lambda: load_df(os.path.join(tmpdir, "folder", "*x.parquet")))
+
     # overwrite folder with single file
     save_df(actual, os.path.join(tmpdir, "folder.parquet"), mode="overwrite")
     actual = load_df(os.path.join(tmpdir, "folder.parquet"))
     df_eq(actual, [["1", 2, 3], ["1", 2, 3]], "a:str,b:int,c:long")
 
+    # pandas arguments
+    actual = load_df(f1, engine="pyarrow")
+    df_eq(actual, [["1", 2, 3]], "a:str,b:int,c:long")
+    actual = load_df([f1, f1], columns=["a"], storage_options={})
+    df_eq(actual, [["1"], ["1"]], "a:str")
+
     # overwrite = False
     raises(FileExistsError, lambda: save_df(df1, f1, mode="error"))
     raises(
@@ -177,6 +210,60 @@ def test_parquet_io(tmpdir):
     raises(NotImplementedError, lambda: save_df(df1, f1, mode="dummy"))
 
 
+def test_load_converted_types(tmpdir):
+    path = os.path.join(tmpdir, "a.parquet")
+    df = PandasDataFrame(
+        [[1.0, True, "2021-01-01", 1]], "a:double,b:bool,c:datetime,d:int"
+    )
+    save_df(df, path)
+    # string conversions are done by pandas, not arrow
+    actual = load_df(path, columns="a:str,b:str,c:str,d:str")
+    assert [["1.0", "True", "2021-01-01", "1"]] == actual.as_array()
+    actual = load_df(path, columns="d:long,a:float")
+    assert actual.schema == "d:long,a:float"
+    assert [[1, 1.0]] == actual.as_array()
+
+
+def test_load_mixed_formats(tmpdir):
+    # json would read "1" as a number
+    df1 = PandasDataFrame([["x", 2, 3]], "a:str,b:int,c:long")
+    f1 = os.path.join(tmpdir, "a.parquet")
+    f2 = os.path.join(tmpdir, "b.json")
+    save_df(df1, f1)
+    save_df(df1, f2)
+    actual = load_df([f1, f2], columns="a:str,b:int,c:long")
+    df_eq(actual, [["x", 2, 3], ["x", 2, 3]], "a:str,b:int,c:long")
+
+
+def test_load_different_parquet_schemas(tmpdir):
+    f1 = os.path.join(tmpdir, "a.parquet")
+    f2 = os.path.join(tmpdir, "b.parquet")
+    save_df(PandasDataFrame([[1, 2]], "a:long,b:long"), f1)
+    save_df(PandasDataFrame([[3, 4, 0.5]], "a:long,b:long,c:double"), f2)
+    for parallel in [True, False]:
+        actual = load_df([f1, f2], parallel=parallel)
+        df_eq(actual, [[1, 2, None], [3, 4, 0.5]], "a:long,b:long,c:double")
+        actual = load_df([f2, f1], parallel=parallel)
+        df_eq(actual, [[3, 4, 0.5], [1, 2, None]], "a:long,b:long,c:double")
+
+
+def test_load_different_types(tmpdir):
+    f1 = os.path.join(tmpdir, "a.parquet")
+    f2 = os.path.join(tmpdir, "b.parquet")
+    save_df(PandasDataFrame([[1]], "a:long"), f1)
+    save_df(PandasDataFrame([[1.5]], "a:double"), f2)
+    for parallel in [True, False]:
+        actual = load_df([f1, f2], parallel=parallel)
+        df_eq(actual, [[1.0], [1.5]], "a:double")
+
+    folder = os.path.join(tmpdir, "folder")
+    FileSystem().makedirs(folder)
+    save_df(PandasDataFrame([[1]], "a:long"), os.path.join(folder, "a.avro"))
+    save_df(PandasDataFrame([[1.5]], "a:double"), os.path.join(folder, "b.avro"))
+    actual = load_df(folder, "avro")
+    df_eq(actual, [[1.0], [1.5]], "a:double")
+
+
 def test_csv_io(tmpdir):
     fs = FileSystem()
     df1 = PandasDataFrame([["1", 2, 3]], "a:str,b:int,c:long")
@@ -209,6 +296,57 @@ def test_csv_io(tmpdir):
     )
 
 
+def test_csv_io_engines(tmpdir):
+    fs = FileSystem()
+    df1 = PandasDataFrame([["1", 2, 3], [None, 4, 5]], "a:str,b:int,c:long")
+    folder = os.path.join(tmpdir, "folder")
+    fs.makedirs(folder)
+    save_df(df1, os.path.join(folder, "1.csv"), sep="|", header=True)
+    save_df(df1, os.path.join(folder, "2.csv"), sep="|", header=True)
+    for engine in [{}, {"engine": "pandas"}]:
+        actual = load_df(folder, "csv", sep="|", header=True, **engine)
+        df_eq(actual, [["1", "2", "3"], [None, "4", "5"]] * 2, "a:str,b:str,c:str")
+        actual = load_df(
+            folder, "csv", columns="c:long,a:str", sep="|", header=True, **engine
+        )
+        df_eq(actual, [[3, "1"], [5, None]] * 2, "c:long,a:str")
+
+    # gzipped files
+    path = os.path.join(tmpdir, "a.csv.gz")
+    df1.as_pandas().to_csv(path, index=False, compression="gzip")
+    actual = load_df(path, header=True)
+    df_eq(actual, [["1", "2", "3"], [None, "4", "5"]], "a:str,b:str,c:str")
+
+    # dates are not inferred
+    path = os.path.join(tmpdir, "dates.csv")
+    fs.writetext(path, "a,b\n2021-01-01,2021-01-01 10:00:00\n")
+    actual = load_df(path, header=True, infer_schema=True)
+    df_eq(actual, [["2021-01-01", "2021-01-01 10:00:00"]], "a:str,b:str")
+
+
+def test_csv_errors(tmpdir):
+    fs = FileSystem()
+    path = os.path.join(tmpdir, "a.csv")
+    fs.writetext(path, "a,b\n1,2\n")
+    # failed reads used to hang the threaded reader from time to time
+    for _ in range(200):
+        raises(KeyError, lambda: load_df(path, columns="b:str,x:double", header=True))
+    fs.writetext(path, "a,b\n1,2\n1,2,3\n")
+    raises(pd.errors.ParserError, lambda: load_df(path, header=True))
+
+
+def test_csv_arrow_strings(tmpdir):
+    fs = FileSystem()
+    path = os.path.join(tmpdir, "a.csv")
+    fs.writetext(path, "a,b\n1,2\n,4\n")
+    actual = load_df(path, header=True, engine="pandas")
+    if _CSV_STRING_DTYPE is not object:  # arrow backed strings, same as arrow
+        assert [["1", "2"], [None, "4"]] == actual.as_array()
+    assert actual.schema == "a:str,b:str"
+    actual = load_df(path, columns="b:long,a:str", header=True, engine="pandas")
+    assert [[2, "1"], [4, None]] == actual.as_array()
+
+
 def test_json(tmpdir):
     fs = FileSystem()
     df1 = PandasDataFrame([["1", 2, 3]], "a:str,b:int,c:long")
@@ -303,3 +441,49 @@ def test_avro_io(tmpdir):
         ],
     }
     raises(TypeError, lambda: save_df(df2, path2, schema=schema))
+
+
+def test_avro_types(tmpdir):
+    from fastavro import writer
+
+    schema = {
+        "type": "record",
+        "name": "Root",
+        "fields": [
+            {"name": "a", "type": ["null", "long"]},
+            {"name": "b", "type": {"type": "array", "items": "int"}},
+            {
+                "name": "c",
+                "type": {"type": "enum", "name": "E", "symbols": ["X", "Y"]},
+            },
+        ],
+    }
+    path = os.path.join(tmpdir, "a.avro")
+    with open(path, "wb") as fp:
+        writer(fp, schema, [dict(a=1, b=[1, 2], c="X"), dict(a=None, b=[], c="Y")])
+    actual = load_df(path)
+    assert actual.schema == "a:double,b:[long],c:str"  # pandas has no null ints
+    assert [[1, [1, 2], "X"], [None, [], "Y"]] == actual.as_array(type_safe=True)
+    actual = load_df(path, columns=["c", "a"])
+    assert [["X", 1], ["Y", None]] == actual.as_array(type_safe=True)
+
+    # d refers to the enum defined in c, so it can't be projected without c
+    schema["fields"].append({"name": "d", "type": "E"})
+    with open(path, "wb") as fp:
+        writer(fp, schema, [dict(a=1, b=[1], c="X", d="Y")])
+    actual = load_df(path, columns=["d", "a"])
+    assert [["Y", 1]] == actual.as_array(type_safe=True)
+    actual = load_df(path, columns="b:[long],a:long")
+    assert [[[1], 1]] == actual.as_array(type_safe=True)
+
+    # maps are loaded by pandas as before, not inferred as structs by arrow
+    schema = {
+        "type": "record",
+        "name": "Root",
+        "fields": [{"name": "m", "type": {"type": "map", "values": "int"}}],
+    }
+    with open(path, "wb") as fp:
+        writer(fp, schema, [dict(m={"x": 1}), dict(m={"y": 2})])
+    actual = load_df(path)
+    assert actual.schema == "m:{x:long,y:long}"
+    assert [[{"x": 1}], [{"y": 2}]] == actual.as_array()